@@ -4,6 +4,9 @@ import re
 import nltk
 from PyPDF2 import PdfReader
 from datetime import datetime
+from upload_ingest import (
+    MAX_TEXT_CHARS, MAX_UPLOAD_BYTES, MB, UploadRejected, decode_text, open_upload
+)
 
 # Download NLTK data with error handling
 @st.cache_resource
@@ -44,11 +47,17 @@ def clean_text(text):
 def extract_text_from_pdf(file):
     try:
         pdf = PdfReader(file)
-        text = ""
+        parts = []
+        total = 0
         for page in pdf.pages:
             page_text = page.extract_text()
             if page_text:
-                text += page_text + " "
+                parts.append(page_text)
+                total += len(page_text) + 1
+            # Stop once we have more text than a resume could need
+            if total >= MAX_TEXT_CHARS:
+                break
+        text = " ".join(parts)[:MAX_TEXT_CHARS]
         return text.strip() if text else "No text could be extracted from PDF"
     except Exception as e:
         return f"Error extracting PDF: {str(e)}"
@@ -530,18 +539,24 @@ def main():
             upload_file = st.file_uploader(
                 "Choose a file (PDF or TXT)",
                 type=["txt", "pdf"],
-                help="Maximum file size: 200MB",
+                help=f"Maximum file size: {MAX_UPLOAD_BYTES // MB}MB",
                 label_visibility="collapsed"
             )
         
         if upload_file is not None:
             # Show loading spinner
             with st.spinner("Processing resume..."):
-                # Extract text
-                if upload_file.type == "application/pdf":
-                    resume_text = extract_text_from_pdf(upload_file)
-                else:
-                    resume_text = upload_file.read().decode('utf-8', errors='ignore')
+                # Extract text (large uploads are spooled to disk within the memory budget)
+                try:
+                    kind = 'pdf' if upload_file.type == "application/pdf" else 'txt'
+                    with open_upload(upload_file, kind) as stream:
+                        if kind == 'pdf':
+                            resume_text = extract_text_from_pdf(stream)
+                        else:
+                            resume_text = decode_text(stream)
+                except UploadRejected as e:
+                    st.error(str(e))
+                    st.stop()
                 
                 # Clean text
                 resume_text = clean_text(resume_text)
@@ -0,0 +1,442 @@
+"""
+Load-test harness for the resume screening pipeline.
+
+Generates a synthetic resume corpus (TXT and PDF, varying length and page
+count) from the categories in UpdatedResumeDataSet.xls, drives it through the
+same pipeline app.py runs for an upload, and writes throughput, per-stage
+latency percentiles and peak RSS to a JSON file for comparison across commits.
+With --large-ratio, a share of the resumes are padded to --large-mb so the
+large-upload path in upload_ingest.py is exercised too.
+
+Usage:
+    python benchmark.py --resumes 200 --concurrency 4 --output bench.json
+    python benchmark.py --resumes 40 --large-ratio 0.25 --large-mb 15
+"""
+
+import argparse
+import io
+import json
+import math
+import pickle
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak_rss_mb() falls back to psutil
+    resource = None
+
+from app import (
+    clean_text,
+    extract_text_from_pdf,
+    extract_name,
+    extract_email,
+    extract_phone,
+    extract_skills,
+    extract_languages,
+    extract_summary,
+)
+from upload_ingest import MB, UploadBudget, UploadRejected, decode_text, open_upload
+
+STAGES = ["extract_text", "clean_text", "extract_fields", "tfidf_transform", "predict"]
+
+# Upload groups reported separately. With --phased they are also run one at
+# a time in this order, smallest first, so the growth in peak RSS during each
+# group can be attributed to that kind of upload
+GROUPS = ["txt", "pdf", "large_txt", "large_pdf"]
+
+FIRST_NAMES = ["John", "Priya", "Ahmed", "Maria", "Kenji", "Olivia", "Ravi", "Fatima", "Lucas", "Amara"]
+LAST_NAMES = ["Smith", "Perera", "Khan", "Garcia", "Tanaka", "Brown", "Kumar", "Silva", "Martin", "Okafor"]
+
+# Roughly how many characters fit on one page of the generated PDFs
+LINES_PER_PAGE = 50
+CHARS_PER_LINE = 90
+
+
+# Synthetic corpus generation
+def load_dataset(path='UpdatedResumeDataSet.xls'):
+    """Load the training sheet (it is a CSV despite the extension)"""
+    df = pd.read_csv(path)
+    return df.dropna(subset=['Category', 'Resume'])
+
+
+def make_resume_text(rng, category, resume_bodies, target_chars):
+    """Build a synthetic resume for a category by stitching dataset snippets"""
+    first = rng.choice(FIRST_NAMES)
+    last = rng.choice(LAST_NAMES)
+    phone = "".join(str(rng.randint(0, 9)) for _ in range(10))
+
+    header = [
+        f"{first} {last}",
+        f"{category}",
+        f"Email: {first.lower()}.{last.lower()}{rng.randint(10, 99)}@example.com",
+        f"Phone: {phone}",
+        "",
+        "Professional Summary",
+    ]
+    parts = ["\n".join(header) + "\n"]
+    length = len(parts[0])
+
+    # Repeat shuffled dataset resumes of the same category until long enough
+    while length < target_chars:
+        body = rng.choice(resume_bodies) + "\n"
+        parts.append(body)
+        length += len(body)
+    return "".join(parts)[:target_chars]
+
+
+def wrap_lines(text, width=CHARS_PER_LINE):
+    """Split text into fixed-width lines for PDF layout"""
+    lines = []
+    for paragraph in text.split('\n'):
+        if not paragraph:
+            lines.append("")
+            continue
+        for i in range(0, len(paragraph), width):
+            lines.append(paragraph[i:i + width])
+    return lines
+
+
+def _pdf_escape(line):
+    line = line.encode('latin-1', errors='ignore').decode('latin-1')
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def make_pdf(text):
+    """
+    Render text into a minimal multi-page PDF (Helvetica, no dependencies).
+    Returns the PDF bytes and the number of pages.
+    """
+    lines = wrap_lines(text)
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+
+    # Object 1: catalog, 2: page tree, 3: font, then a (page, content) pair per page
+    objects = []
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for page_id, page_lines in zip(page_ids, pages):
+        stream = "BT /F1 10 Tf 12 TL 40 800 Td\n"
+        stream += "".join(f"({_pdf_escape(line)}) Tj T*\n" for line in page_lines)
+        stream += "ET"
+        stream = stream.encode('latin-1')
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+
+    xref_offset = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset))
+    return out.getvalue(), len(pages)
+
+
+def render(kind, text):
+    """Upload bytes for a resume and its page count (None for TXT)"""
+    if kind == "pdf":
+        return make_pdf(text)
+    return text.encode('utf-8'), None
+
+
+def generate_corpus(df, count, pdf_ratio=0.5, min_pages=1, max_pages=5, seed=42,
+                    large_ratio=0.0, large_mb=20):
+    """
+    Generate `count` synthetic resumes as dicts of kind, group, category, raw
+    bytes and the real page count of PDFs. Large resumes (about `large_mb` MB each) are only described
+    here and rendered by load_payload() when they are run, so the corpus does
+    not hold them all in memory at once.
+    """
+    rng = random.Random(seed)
+    by_category = df.groupby('Category')['Resume'].apply(list).to_dict()
+    categories = sorted(by_category)
+    page_chars = LINES_PER_PAGE * CHARS_PER_LINE
+
+    corpus = []
+    for _ in range(count):
+        category = rng.choice(categories)
+        kind = "pdf" if rng.random() < pdf_ratio else "txt"
+
+        if rng.random() < large_ratio:
+            target_chars = large_mb * MB
+            corpus.append({
+                "kind": kind, "group": f"large_{kind}", "category": category, "data": None,
+                "bodies": by_category[category], "seed": rng.random(),
+                "target_chars": target_chars, "pages": None,
+            })
+            continue
+
+        pages = rng.randint(min_pages, max_pages)
+        # Vary length within the page budget so page breaks land in different places
+        target_chars = rng.randint(page_chars * (pages - 1) + page_chars // 4, page_chars * pages)
+        text = make_resume_text(rng, category, by_category[category], target_chars)
+        data, page_count = render(kind, text)
+        corpus.append({
+            "kind": kind, "group": kind, "category": category,
+            "data": data, "pages": page_count,
+        })
+    return corpus
+
+
+def load_payload(item):
+    """Raw upload bytes and page count for a corpus item, rendering large resumes on demand"""
+    if item["data"] is not None:
+        return item["data"], item["pages"]
+    rng = random.Random(item["seed"])
+    text = make_resume_text(rng, item["category"], item["bodies"], item["target_chars"])
+    return render(item["kind"], text)
+
+
+# Pipeline driver
+def run_pipeline(item, clf, tfidf, budget):
+    """
+    Run one resume through the app pipeline and return per-stage latencies
+    (seconds) plus the PDF page count, or None if the upload budget rejected
+    it as the app would.
+    """
+    # Held for the whole run, like the buffer Streamlit keeps for an upload
+    payload, page_count = load_payload(item)
+    timings = {}
+
+    start = time.perf_counter()
+    try:
+        with open_upload(io.BytesIO(payload), item["kind"], budget) as stream:
+            if item["kind"] == "pdf":
+                resume_text = extract_text_from_pdf(stream)
+            else:
+                resume_text = decode_text(stream)
+    except UploadRejected:
+        return None
+    timings["extract_text"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    resume_text = clean_text(resume_text)
+    timings["clean_text"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    extract_name(resume_text)
+    extract_email(resume_text)
+    extract_phone(resume_text)
+    extract_skills(resume_text)
+    extract_languages(resume_text)
+    extract_summary(resume_text)
+    timings["extract_fields"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    input_features = tfidf.transform([resume_text])
+    timings["tfidf_transform"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clf.predict(input_features)
+    if hasattr(clf, 'predict_proba'):
+        clf.predict_proba(input_features)
+    timings["predict"] = time.perf_counter() - start
+
+    timings["total"] = sum(timings.values())
+    timings["pages"] = page_count
+    return timings
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * pct / 100))
+    return ordered[rank - 1]
+
+
+def summarize(samples):
+    """Latency summary in milliseconds"""
+    return {
+        "count": len(samples),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3) if samples else 0.0,
+    }
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    if resource is None:
+        import psutil
+        # peak_wset is the Windows peak working set, in bytes
+        return round(psutil.Process().memory_info().peak_wset / (1024 * 1024), 1)
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    if sys.platform == 'darwin':
+        return round(peak / (1024 * 1024), 1)
+    return round(peak / 1024, 1)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+
+def run_benchmark(corpus, clf, tfidf, concurrency=1, warmup=5, phased=False):
+    """
+    Drive the corpus through the pipeline and collect latency/throughput stats.
+
+    By default all resumes run as one mixed workload, so large and small
+    uploads compete for the upload budget as they would in the app. With
+    `phased`, each group runs on its own and the report adds per-group RSS.
+    """
+    # Same limits as the app, so rejections under load show up in the report
+    budget = UploadBudget()
+
+    for item in [item for item in corpus if item["data"] is not None][:warmup]:
+        run_pipeline(item, clf, tfidf, budget)
+
+    phases = [[item for item in corpus if item["group"] == group] for group in GROUPS] if phased else [corpus]
+
+    results = []
+    items_run = []
+    rss_by_kind = {}
+    elapsed = 0.0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for items in phases:
+            if not items:
+                continue
+
+            rss_before = peak_rss_mb()
+            start = time.perf_counter()
+            results.extend(pool.map(lambda item: run_pipeline(item, clf, tfidf, budget), items))
+            elapsed += time.perf_counter() - start
+            items_run.extend(items)
+
+            if phased:
+                rss_by_kind[items[0]["group"]] = {
+                    "peak_rss_mb": peak_rss_mb(),
+                    "rss_growth_mb": round(peak_rss_mb() - rss_before, 1),
+                }
+
+    by_kind = {}
+    rejected_by_kind = {}
+    for group in GROUPS:
+        group_results = [r for r, item in zip(results, items_run) if item["group"] == group]
+        if not group_results:
+            continue
+        totals = [r["total"] for r in group_results if r is not None]
+        if totals:
+            by_kind[group] = summarize(totals)
+        rejected_by_kind[group] = group_results.count(None)
+
+    completed = [r for r in results if r is not None]
+    stages = {stage: summarize([r[stage] for r in completed]) for stage in STAGES + ["total"]}
+
+    # PDF latency by the real number of pages rendered
+    by_pages = {}
+    for page_count in sorted({r["pages"] for r in completed if r["pages"] is not None}):
+        by_pages[str(page_count)] = summarize([r["total"] for r in completed if r["pages"] == page_count])
+
+    return {
+        "mode": "phased" if phased else "mixed",
+        "resumes": len(corpus),
+        "completed": len(completed),
+        "rejected": len(results) - len(completed),
+        "rejected_by_kind": rejected_by_kind,
+        "rss_by_kind": rss_by_kind,
+        "concurrency": concurrency,
+        "wall_time_s": round(elapsed, 3),
+        "throughput_per_s": round(len(completed) / elapsed, 2) if elapsed else 0.0,
+        "stages": stages,
+        "by_kind": by_kind,
+        "pdf_by_pages": by_pages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the resume screening pipeline")
+    parser.add_argument('--resumes', type=int, default=200, help="number of synthetic resumes")
+    parser.add_argument('--concurrency', type=int, default=1, help="worker threads driving the pipeline")
+    parser.add_argument('--pdf-ratio', type=float, default=0.5, help="fraction of resumes rendered as PDF")
+    parser.add_argument('--min-pages', type=int, default=1)
+    parser.add_argument('--max-pages', type=int, default=5)
+    parser.add_argument('--large-ratio', type=float, default=0.0,
+                        help="fraction of resumes padded to --large-mb to exercise large uploads")
+    parser.add_argument('--large-mb', type=int, default=15,
+                        help="approximate size of large resumes in MB (the app accepts up to 20MB)")
+    parser.add_argument('--phased', action='store_true',
+                        help="run each kind of upload on its own to attribute peak RSS per kind "
+                             "(default: one mixed workload)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--warmup', type=int, default=5, help="untimed resumes run before measuring")
+    parser.add_argument('--dataset', default='UpdatedResumeDataSet.xls')
+    parser.add_argument('--output', default='bench_output.json', help="where to save the JSON results")
+    args = parser.parse_args()
+
+    if args.resumes < 1 or args.concurrency < 1:
+        parser.error("--resumes and --concurrency must be at least 1")
+    if args.min_pages < 1:
+        parser.error("--min-pages must be at least 1")
+    if args.min_pages > args.max_pages:
+        parser.error("--min-pages cannot be greater than --max-pages")
+    if not 0 <= args.pdf_ratio <= 1 or not 0 <= args.large_ratio <= 1:
+        parser.error("--pdf-ratio and --large-ratio must be between 0 and 1")
+    if args.large_mb < 1:
+        parser.error("--large-mb must be at least 1")
+
+    clf = pickle.load(open('clf.pkl', 'rb'))
+    tfidf = pickle.load(open('tfidf.pkl', 'rb'))
+
+    df = load_dataset(args.dataset)
+    corpus = generate_corpus(df, args.resumes, args.pdf_ratio, args.min_pages, args.max_pages, args.seed,
+                             args.large_ratio, args.large_mb)
+
+    report = run_benchmark(corpus, clf, tfidf, args.concurrency, args.warmup, args.phased)
+    report.update({
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+        "python": sys.version.split()[0],
+        "settings": vars(args),
+        # Large resumes are counted at their target size since they are rendered on demand
+        "corpus_bytes": sum(len(item["data"]) if item["data"] is not None else item["target_chars"]
+                            for item in corpus),
+        "peak_rss_mb": peak_rss_mb(),
+    })
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{report['resumes']} resumes ({report['mode']}), concurrency {report['concurrency']}: "
+          f"{report['throughput_per_s']} resumes/s, peak RSS {report['peak_rss_mb']} MB, "
+          f"{report['rejected']} rejected by the upload budget")
+    for stage in STAGES + ["total"]:
+        s = report["stages"][stage]
+        print(f"  {stage:<16} p50 {s['p50_ms']:>9.3f} ms  p95 {s['p95_ms']:>9.3f} ms  p99 {s['p99_ms']:>9.3f} ms")
+    for page_count, s in report["pdf_by_pages"].items():
+        print(f"  PDF {page_count:>5} pages  p50 {s['p50_ms']:>9.3f} ms  p95 {s['p95_ms']:>9.3f} ms  ({s['count']})")
+    for group, rss in report["rss_by_kind"].items():
+        print(f"  {group:<16} peak RSS {rss['peak_rss_mb']:>9.1f} MB  (+{rss['rss_growth_mb']} MB)")
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
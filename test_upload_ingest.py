@@ -0,0 +1,155 @@
+import io
+import mmap
+
+import pytest
+
+from upload_ingest import (
+    MB, MAX_TEXT_CHARS, MAX_UPLOAD_BYTES, SPOOL_THRESHOLD_BYTES, UploadBudget, UploadRejected,
+    decode_text, estimate_cost, open_upload
+)
+
+
+class FakeUpload(io.BytesIO):
+    """Stands in for Streamlit's UploadedFile, which reports its size up front"""
+
+    def __init__(self, size):
+        super().__init__(b"%PDF-1.4\n")
+        self.size = size
+
+
+class NonSeekableStream(io.RawIOBase):
+    """A stream that can only be read forward, like a network response body"""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._data.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def padded_pdf(text, size):
+    """One-page PDF showing `text`, padded with content-stream comments to `size` bytes"""
+    content = f"BT /F1 12 Tf 40 800 Td ({text}) Tj ET\n".encode()
+    content += b"%" + b"x" * max(0, size - len(content)) + b"\n"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"endstream",
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 6\n0000000000 65535 f \n" + b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size 6 /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % xref
+    return out
+
+
+def test_large_pdfs_rejected_before_concurrency_cap():
+    budget = UploadBudget(max_bytes=128 * MB, max_concurrent=4)
+    with open_upload(FakeUpload(15 * MB), 'pdf', budget):
+        with open_upload(FakeUpload(15 * MB), 'pdf', budget):
+            assert budget.active == 2
+            with pytest.raises(UploadRejected, match="enough free memory"):
+                with open_upload(FakeUpload(15 * MB), 'pdf', budget):
+                    pass
+    assert budget.active == 0
+    assert budget.bytes_in_use == 0
+
+
+def test_small_uploads_limited_by_concurrency():
+    budget = UploadBudget(max_bytes=1024 * MB, max_concurrent=1)
+    with open_upload(FakeUpload(1 * MB), 'txt', budget):
+        with pytest.raises(UploadRejected, match="busy"):
+            with open_upload(FakeUpload(1 * MB), 'txt', budget):
+                pass
+
+
+def test_upload_larger_than_budget_rejected():
+    budget = UploadBudget(max_bytes=32 * MB, max_concurrent=4)
+    with pytest.raises(UploadRejected, match="too large"):
+        with open_upload(FakeUpload(15 * MB), 'pdf', budget):
+            pass
+
+
+def test_upload_over_size_limit_rejected():
+    with pytest.raises(UploadRejected, match="maximum file size"):
+        with open_upload(FakeUpload(MAX_UPLOAD_BYTES + 1), 'txt', UploadBudget()):
+            pass
+
+
+def test_pdf_estimate_grows_with_size():
+    assert estimate_cost(20 * MB, 'pdf') > estimate_cost(1 * MB, 'pdf') > estimate_cost(20 * MB, 'txt')
+
+
+def test_in_memory_upload_is_not_spooled():
+    upload = io.BytesIO(b"x" * (6 * MB))
+    with open_upload(upload, 'txt', UploadBudget()) as stream:
+        assert stream is upload
+
+
+def test_decode_text_caps_length():
+    stream = io.BytesIO("héllo ".encode() * 1000)
+    assert decode_text(stream, max_chars=100) == ("héllo " * 20)[:100]
+
+
+def test_large_file_is_spooled_and_mapped(tmp_path):
+    path = tmp_path / "resume.pdf"
+    data = padded_pdf("Jane Doe", SPOOL_THRESHOLD_BYTES + MB)
+    path.write_bytes(data)
+    budget = UploadBudget()
+
+    with open(path, 'rb') as upload:
+        with open_upload(upload, 'pdf', budget) as stream:
+            assert isinstance(stream, mmap.mmap)
+            assert budget.active == 1
+            assert stream[:] == data
+    assert budget.active == 0
+    assert budget.bytes_in_use == 0
+
+
+def test_pdf_reader_parses_mapped_spool(tmp_path):
+    PyPDF2 = pytest.importorskip("PyPDF2")
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(padded_pdf("Jane Doe", SPOOL_THRESHOLD_BYTES + MB))
+    budget = UploadBudget()
+
+    with open(path, 'rb') as upload:
+        with open_upload(upload, 'pdf', budget) as stream:
+            assert isinstance(stream, mmap.mmap)
+            text = PyPDF2.PdfReader(stream).pages[0].extract_text()
+    assert "Jane Doe" in text
+    assert budget.bytes_in_use == 0
+
+
+def test_non_seekable_stream_is_spooled():
+    data = b"Jane Doe resume " * (SPOOL_THRESHOLD_BYTES // 8)
+    budget = UploadBudget()
+    with open_upload(NonSeekableStream(data), 'txt', budget) as stream:
+        assert isinstance(stream, mmap.mmap)
+        assert decode_text(stream) == data[:MAX_TEXT_CHARS].decode()
+        assert budget.active == 1
+    assert budget.active == 0
+
+
+def test_empty_non_seekable_stream():
+    with open_upload(NonSeekableStream(b""), 'txt', UploadBudget()) as stream:
+        assert decode_text(stream) == ""
+
+
+def test_non_seekable_stream_over_size_limit_rejected():
+    budget = UploadBudget()
+    with pytest.raises(UploadRejected, match="maximum file size"):
+        with open_upload(NonSeekableStream(b"x" * (MAX_UPLOAD_BYTES + 1)), 'txt', budget):
+            pass
+    assert budget.active == 0
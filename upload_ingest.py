@@ -0,0 +1,191 @@
+"""
+Bounded-memory upload ingestion.
+
+Streamlit's UploadedFile is already an in-memory BytesIO, and PdfReader
+reads it in place, so those uploads are parsed straight from that buffer.
+That buffer stays resident for as long as the widget holds the file, so
+.streamlit/config.toml lowers server.maxUploadSize to a resume-sized 20MB.
+Seekable files above SPOOL_THRESHOLD_BYTES that are not already in memory,
+and non-seekable streams of any size, are copied to a temporary file in
+chunks and memory-mapped for parsing. Text uploads are decoded incrementally.
+A process-wide budget caps how many uploads are parsed at once and the
+working memory their parsing may use; uploads over either limit are rejected
+with a message that can be shown to the user instead of risking an OOM kill.
+The budget is held only while text is extracted, so it does not count the
+upload buffers Streamlit keeps resident; those are bounded per upload by
+maxUploadSize instead.
+
+This lives outside app.py on purpose: Streamlit re-executes the main script
+on every rerun, but imported modules (and the budget below) are shared by all
+sessions in the process.
+"""
+
+import codecs
+import io
+import mmap
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+
+MB = 1024 * 1024
+
+MAX_UPLOAD_BYTES = 20 * MB           # keep in sync with server.maxUploadSize
+SPOOL_THRESHOLD_BYTES = 5 * MB       # larger non-memory sources are spooled to disk
+SPOOL_CHUNK_BYTES = 1 * MB           # copy/decode chunk size
+MAX_TEXT_CHARS = 2 * MB              # extracted text beyond this is dropped
+
+MEMORY_BUDGET_BYTES = 160 * MB       # parse working memory per process
+MAX_CONCURRENT_UPLOADS = 4           # uploads parsed at once per process
+
+# PyPDF2's parse state per byte of PDF (roughly 3x the file size when
+# measured). Text is decoded in chunks, so its cost does not grow with size.
+PDF_MEMORY_FACTOR = 3
+
+
+class UploadRejected(Exception):
+    """Raised when an upload cannot be accepted; the message is user-facing"""
+
+
+class UploadBudget:
+    """Process-wide limits on concurrent parses and the working memory they reserve"""
+
+    def __init__(self, max_bytes=MEMORY_BUDGET_BYTES, max_concurrent=MAX_CONCURRENT_UPLOADS):
+        self.max_bytes = max_bytes
+        self.max_concurrent = max_concurrent
+        self.bytes_in_use = 0
+        self.active = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def reserve(self, nbytes):
+        """Reserve memory for one upload, rejecting instead of waiting when full"""
+        with self._lock:
+            if nbytes > self.max_bytes:
+                raise UploadRejected(
+                    "This file is too large for the server to process. "
+                    "Please upload a smaller file."
+                )
+            if self.active >= self.max_concurrent:
+                raise UploadRejected(
+                    "The server is busy processing other resumes. "
+                    "Please try again in a moment."
+                )
+            if self.bytes_in_use + nbytes > self.max_bytes:
+                raise UploadRejected(
+                    "The server does not have enough free memory to process this resume right now. "
+                    "Please try again in a moment or upload a smaller file."
+                )
+            self.active += 1
+            self.bytes_in_use += nbytes
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.bytes_in_use -= nbytes
+
+
+upload_budget = UploadBudget()
+
+
+def upload_size(upload_file):
+    """Size in bytes of an uploaded file (Streamlit's UploadedFile or any seekable stream)"""
+    size = getattr(upload_file, 'size', None)
+    if size is None:
+        position = upload_file.tell()
+        size = upload_file.seek(0, 2)
+        upload_file.seek(position)
+    return size
+
+
+def check_size(size):
+    if size > MAX_UPLOAD_BYTES:
+        raise UploadRejected(
+            f"File is {size / MB:.1f}MB; the maximum file size is {MAX_UPLOAD_BYTES // MB}MB."
+        )
+
+
+def estimate_cost(size, kind):
+    """Working memory reserved while parsing an upload, plus its extracted text"""
+    if kind == 'pdf':
+        return size * PDF_MEMORY_FACTOR + MAX_TEXT_CHARS
+    return SPOOL_CHUNK_BYTES + MAX_TEXT_CHARS
+
+
+def spool_stream(stream, spool):
+    """Copy a non-seekable stream into a spool file in chunks, returning its size"""
+    size = 0
+    while True:
+        chunk = stream.read(SPOOL_CHUNK_BYTES)
+        if not chunk:
+            return size
+        size += len(chunk)
+        # Reject as soon as the limit is crossed rather than after reading it all
+        check_size(size)
+        spool.write(chunk)
+
+
+@contextmanager
+def map_spool(spool, size):
+    """Yield a read-only memory map of a spool file (empty files cannot be mapped)"""
+    spool.flush()
+    if size == 0:
+        spool.seek(0)
+        yield spool
+        return
+    with mmap.mmap(spool.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield mapped
+
+
+@contextmanager
+def open_upload(upload_file, kind, budget=None):
+    """
+    Yield a seekable binary stream for an upload within the memory budget.
+    `kind` is 'pdf' or 'txt' and selects the memory estimate.
+
+    In-memory uploads (Streamlit's UploadedFile) and small seekable files are
+    yielded as-is. Large seekable files are spooled to a temporary file and
+    yielded as a read-only memory map. Non-seekable streams are always
+    spooled, in chunks, with the size limit checked as bytes arrive. Raises
+    UploadRejected if the file is too large or the process is out of budget.
+    """
+    budget = budget or upload_budget
+
+    if not upload_file.seekable():
+        with tempfile.TemporaryFile(prefix='resume-upload-') as spool:
+            size = spool_stream(upload_file, spool)
+            with budget.reserve(estimate_cost(size, kind)), map_spool(spool, size) as stream:
+                yield stream
+        return
+
+    size = upload_size(upload_file)
+    check_size(size)
+
+    with budget.reserve(estimate_cost(size, kind)):
+        upload_file.seek(0)
+        # Copying an in-memory buffer to disk would only add its pages to RSS
+        if isinstance(upload_file, io.BytesIO) or size <= SPOOL_THRESHOLD_BYTES:
+            yield upload_file
+            return
+
+        with tempfile.TemporaryFile(prefix='resume-upload-') as spool:
+            shutil.copyfileobj(upload_file, spool, SPOOL_CHUNK_BYTES)
+            with map_spool(spool, size) as stream:
+                yield stream
+
+
+def decode_text(stream, encoding='utf-8', max_chars=MAX_TEXT_CHARS):
+    """Decode a binary stream chunk by chunk, stopping after max_chars characters"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors='ignore')
+    parts = []
+    total = 0
+    while total < max_chars:
+        chunk = stream.read(SPOOL_CHUNK_BYTES)
+        if not chunk:
+            parts.append(decoder.decode(b'', final=True))
+            break
+        text = decoder.decode(chunk)
+        parts.append(text)
+        total += len(text)
+    return "".join(parts)[:max_chars]